@@ -14,6 +14,8 @@ from guppylang_internals.tys.ty import (
 
 
 from guppy_gpu.definition import (
+    GPU_CONTEXT_TYPE,
+    GPU_MODULE_TYPE,
     QSYSTEM_GPU_EXTENSION,
     ConstGpuModule,
     gpu_module_info,
@@ -32,10 +34,9 @@ class GpuModuleInitCompiler(CustomInoutCallCompiler):
         int_wire = self.builder.load(IntVal(0, width=6))
         ctx_wire = self.builder.add_op(convert_itousize(), int_wire)
 
-        ctx_ty = QSYSTEM_GPU_EXTENSION.get_type("context").instantiate([])
         get_ctx_op = ops.ExtOp(
             QSYSTEM_GPU_EXTENSION.get_op("get_context"),
-            ht.FunctionType([ht.USize()], [ht.Option(ctx_ty)]),
+            ht.FunctionType([ht.USize()], [ht.Option(GPU_CONTEXT_TYPE)]),
         )
         node = self.builder.add_op(get_ctx_op, ctx_wire)
         opt_w: Wire = node[0]
@@ -78,8 +79,6 @@ class GpuModuleCallCompiler(CustomInoutCallCompiler):
         # - a GPU context
         # - any args meant for the GPU function
         assert len(args) >= 1
-        module_ty = QSYSTEM_GPU_EXTENSION.get_type("module").instantiate([])
-        ctx_ty = QSYSTEM_GPU_EXTENSION.get_type("context").instantiate([])
 
         # Function type without Inout context arg (for building)
         assert isinstance(self.node, GlobalCall)
@@ -115,27 +114,27 @@ class GpuModuleCallCompiler(CustomInoutCallCompiler):
             fn_name_arg = ht.StringArg(self.fn_name)
             gpu_opdef = QSYSTEM_GPU_EXTENSION.get_op("lookup_by_name").instantiate(
                 [fn_name_arg, inputs_row_arg, output_row_arg],
-                ht.FunctionType([module_ty], [func_ty]),
+                ht.FunctionType([GPU_MODULE_TYPE], [func_ty]),
             )
         else:
             fn_id_arg = ht.BoundedNatArg(self.fn_id)
             gpu_opdef = QSYSTEM_GPU_EXTENSION.get_op("lookup_by_id").instantiate(
                 [fn_id_arg, inputs_row_arg, output_row_arg],
-                ht.FunctionType([module_ty], [func_ty]),
+                ht.FunctionType([GPU_MODULE_TYPE], [func_ty]),
             )
         gpu_func = self.builder.add_op(gpu_opdef, gpu_module)
 
         # Call the function
         call_op = QSYSTEM_GPU_EXTENSION.get_op("call").instantiate(
             [inputs_row_arg, output_row_arg],
-            ht.FunctionType([ctx_ty, func_ty, *gpu_sig.input], [result_ty]),
+            ht.FunctionType([GPU_CONTEXT_TYPE, func_ty, *gpu_sig.input], [result_ty]),
         )
 
         result = self.builder.add_op(call_op, args[0], gpu_func, *args[1:])
 
         read_opdef = QSYSTEM_GPU_EXTENSION.get_op("read_result").instantiate(
             [output_row_arg],
-            ht.FunctionType([result_ty], [ctx_ty, *gpu_sig.output]),
+            ht.FunctionType([result_ty], [GPU_CONTEXT_TYPE, *gpu_sig.output]),
         )
         data = self.builder.add_op(read_opdef, result)  # ctx + return types
         match list(data[:]):
@@ -35,6 +35,15 @@ def mkhash(x: bytes) -> int:
     return int.from_bytes(hsh[:4], byteorder="little")
 
 
+# Function IDs of the GPU library entry points, i.e. `mkhash` of each symbol name.
+# Precomputed so that decorating `Decoder` doesn't hash anything at import time.
+_FN_IDS: dict[str, int] = {
+    "enqueue_syndromes_ui64": 0xD93BD8B0,
+    "get_corrections_ui64": 0xEC23349B,
+    "reset_decoder_ui64": 0x0DA043A5,
+}
+
+
 @gpu_module("cudaq-qec", None)
 class Decoder:
     """Realtime decoding using Nvidia GPUs on Quantinuum hardware.
@@ -52,7 +61,7 @@ class Decoder:
 
     """
 
-    @gpu(mkhash(b"enqueue_syndromes_ui64"))
+    @gpu(_FN_IDS["enqueue_syndromes_ui64"])
     @no_type_check
     def enqueue_syndromes(
         self: "Decoder", decoder_id: int, syndrome_size: int, syndrome: int, tag: int
@@ -69,7 +78,7 @@ class Decoder:
 
         """
 
-    @gpu(mkhash(b"get_corrections_ui64"))
+    @gpu(_FN_IDS["get_corrections_ui64"])
     @no_type_check
     def get_corrections(
         self: "Decoder", decoder_id: int, return_size: int, reset: int
@@ -90,7 +99,7 @@ class Decoder:
 
         """
 
-    @gpu(mkhash(b"reset_decoder_ui64"))
+    @gpu(_FN_IDS["reset_decoder_ui64"])
     def reset_decoder(self: "Decoder", decoder_id: int) -> None:
         """Reset the decoder. This clears any queued syndromes and resets any corrections back to 0.
 
@@ -108,7 +117,10 @@ class Decoder:
 @guppy
 @no_type_check
 def pack_int(N: nat @ comptime, data: "array[bool, N]" @ owned) -> int:
-    """Pack a bool array into an integer (big-endian)."""
+    """Pack a bool array into an integer (big-endian).
+
+    Panics if N > 64, since the packed value must fit the decoder's uint64 inputs.
+    """
     if N > 64:
         panic("Invalid array size for decoder")
 
@@ -123,4 +135,15 @@ def pack_int(N: nat @ comptime, data: "array[bool, N]" @ owned) -> int:
 @no_type_check
 def unpack_int(data: int, N: nat @ comptime) -> "array[bool, N]":
     """Unpack an integer (assuming big-endian) into a bool array of size N."""
-    return array(bool(1 & (data >> (N - n - 1))) for n in range(N))
+    return array((1 & (data >> (N - n - 1))) != 0 for n in range(N))
+
+
+@guppy
+@no_type_check
+def unpack_int_le(data: int, N: nat @ comptime) -> "array[bool, N]":
+    """Unpack an integer (assuming little-endian) into a bool array of size N.
+
+    This matches the bit order used by `Decoder.get_corrections`, where the least
+    significant bit is the first correction.
+    """
+    return array((1 & (data >> n)) != 0 for n in range(N))
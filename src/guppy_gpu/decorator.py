@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import inspect
+import sys
 from types import FrameType
 from typing import TYPE_CHECKING, ParamSpec, TypeVar, overload, Callable
 
@@ -45,15 +45,20 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 P = ParamSpec("P")
 
+# Registering is idempotent and survives `ENGINE.reset()`, so once is enough
+ENGINE.register_extension(QSYSTEM_GPU_EXTENSION)
+
+# Input of constructors that take a nat argument, shared between all modules
+_NAT_OWNED_INPUT = FuncInput(NumericType(NumericType.Kind.Nat), flags=InputFlags.Owned)
+
 
 def get_calling_frame() -> FrameType:
     """Finds the first frame that called this function outside the compiler modules."""
-    frame = inspect.currentframe()
+    # Compare filenames rather than calling `inspect.getmodule`, which scans
+    # `sys.modules` on every step
+    frame: FrameType | None = sys._getframe(1)
     while frame:
-        module = inspect.getmodule(frame)
-        if module is None:
-            return frame
-        if module.__file__ != __file__:
+        if frame.f_code.co_filename != __file__:
             return frame
         frame = frame.f_back
     raise RuntimeError("Couldn't obtain stack frame for definition")
@@ -89,8 +94,6 @@ def ext_module_decorator(
         filename: str, module: str | None
     ) -> Callable[[builtins.type[T]], GuppyDefinition]:
         def dec(cls: builtins.type[T]) -> GuppyDefinition:
-            ENGINE.register_extension(QSYSTEM_GPU_EXTENSION)
-
             # N.B. Only one module per file and vice-versa
             ext_module = type_def(
                 DefId.fresh(),
@@ -102,23 +105,14 @@ def ext_module_decorator(
 
             ext_module_ty = ext_module.check_instantiate([], None)
 
-            DEF_STORE.register_def(ext_module, get_calling_frame())
+            frame = get_calling_frame()
+            DEF_STORE.register_def(ext_module, frame)
             for val in cls.__dict__.values():
                 if isinstance(val, GuppyDefinition):
                     DEF_STORE.register_impl(ext_module.id, val.wrapped.name, val.id)
             # Add a constructor to the class
-            if init_arg:
-                init_fn_ty = FunctionType(
-                    [
-                        FuncInput(
-                            NumericType(NumericType.Kind.Nat),
-                            flags=InputFlags.Owned,
-                        )
-                    ],
-                    ext_module_ty,
-                )
-            else:
-                init_fn_ty = FunctionType([], ext_module_ty)
+            init_inputs = [_NAT_OWNED_INPUT] if init_arg else []
+            init_fn_ty = FunctionType(init_inputs, ext_module_ty)
 
             call_method = CustomFunctionDef(
                 DefId.fresh(),
@@ -142,10 +136,9 @@ def ext_module_decorator(
                 GlobalConstId.fresh(f"{cls.__name__}.__discard__"),
                 True,
             )
-            DEF_STORE.register_def(call_method, get_calling_frame())
-            DEF_STORE.register_impl(ext_module.id, "__new__", call_method.id)
-            DEF_STORE.register_def(discard, get_calling_frame())
-            DEF_STORE.register_impl(ext_module.id, "discard", discard.id)
+            for method in (call_method, discard):
+                DEF_STORE.register_def(method, frame)
+                DEF_STORE.register_impl(ext_module.id, method.name, method.id)
 
             return GuppyDefinition(ext_module)
 
@@ -19,7 +19,6 @@ from guppylang_internals.tys.ty import (
     InputFlags,
     NoneType,
     NumericType,
-    OpaqueType,
     Type,
 )
 from hugr import tys as ht
@@ -35,6 +34,13 @@ if TYPE_CHECKING:
     from guppylang_internals.checker.core import Globals
 
 QSYSTEM_GPU_EXTENSION = gpu()
+GPU_MODULE_TYPE = QSYSTEM_GPU_EXTENSION.get_type("module").instantiate([])
+GPU_CONTEXT_TYPE = QSYSTEM_GPU_EXTENSION.get_type("context").instantiate([])
+
+# Guppy types that can be passed to a GPU function
+_VALID_GPU_ARG_TYPES: frozenset[type[Type]] = frozenset({NumericType})
+# Guppy types that can be returned from a GPU function
+_VALID_GPU_RET_TYPES: frozenset[type[Type]] = _VALID_GPU_ARG_TYPES | {NoneType}
 
 
 class RawGpuFunctionDef(RawCustomFunctionDef):
@@ -50,19 +56,11 @@ class RawGpuFunctionDef(RawCustomFunctionDef):
         for inp in fun_ty.inputs[1:]:
             if not self.is_valid_gpu_type(inp.ty):
                 raise GuppyError(UnconvertibleType(loc, inp.ty))
-        if not self.is_valid_gpu_type(fun_ty.output):
-            match fun_ty.output:
-                case NoneType():
-                    pass
-                case _:
-                    raise GuppyError(UnconvertibleType(loc, fun_ty.output))
+        if type(fun_ty.output) not in _VALID_GPU_RET_TYPES:
+            raise GuppyError(UnconvertibleType(loc, fun_ty.output))
 
     def is_valid_gpu_type(self, ty: Type) -> bool:
-        match ty:
-            case NumericType():
-                return True
-
-        return False
+        return type(ty) in _VALID_GPU_ARG_TYPES
 
     def parse(self, globals: "Globals", sources: SourceMap) -> "CustomFunctionDef":
         parsed = super().parse(globals, sources)
@@ -78,14 +76,14 @@ class ConstGpuModule(val.ExtensionValue):
     gpu_config: str | None
 
     def to_value(self) -> val.Extension:
-        ty = QSYSTEM_GPU_EXTENSION.get_type("module").instantiate([])
-
         name = "ConstGpuModule"
         payload = {
             "module_filename": self.gpu_file,
             "config_filename": self.gpu_config,
         }
-        return val.Extension(name, typ=ty, val=payload, extensions=["tket.gpu"])
+        return val.Extension(
+            name, typ=GPU_MODULE_TYPE, val=payload, extensions=["tket.gpu"]
+        )
 
     def __str__(self) -> str:
         return (
@@ -110,16 +108,18 @@ class GpuModuleTypeDef(OpaqueTypeDef):
         super().__init__(id, name, defined_at, [], True, True, self.to_hugr)
         self.gpu_file: str = gpu_file
         self.gpu_config: str = gpu_config
+        # Precomputed result of `gpu_module_info` for instances of this type
+        self._gpu_module_info: tuple[str, str | None] = (gpu_file, gpu_config)
 
     def to_hugr(
         self, args: Sequence[TypeArg | ConstArg], _: ToHugrContext, /
     ) -> ht.Type:
         assert args == []
-        ty = QSYSTEM_GPU_EXTENSION.get_type("context")
-        return ty.instantiate([])
+        return GPU_CONTEXT_TYPE
 
 
 def gpu_module_info(ty: Type) -> tuple[str, str | None] | None:
-    if isinstance(ty, OpaqueType) and isinstance(ty.defn, GpuModuleTypeDef):
-        return ty.defn.gpu_file, ty.defn.gpu_config
-    return None
+    # Only `GpuModuleTypeDef` sets `_gpu_module_info`, so this is equivalent to
+    # checking for an `OpaqueType` defined by a `GpuModuleTypeDef`
+    defn = getattr(ty, "defn", None)
+    return getattr(defn, "_gpu_module_info", None)
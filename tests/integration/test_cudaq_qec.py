@@ -0,0 +1,91 @@
+from typing import no_type_check
+
+import pytest
+from guppylang.decorator import guppy
+from guppylang.emulator.exceptions import EmulatorError
+from guppylang.std.builtins import array
+
+from guppy_gpu.cudaq_qec import (
+    _FN_IDS,
+    Decoder,
+    mkhash,
+    pack_int,
+    unpack_int,
+    unpack_int_le,
+)
+
+
+def test_fn_ids():
+    for name, fn_id in _FN_IDS.items():
+        assert fn_id == mkhash(name.encode())
+
+
+def test_decoder(validate):
+    @guppy
+    @no_type_check
+    def main() -> int:
+        dec = Decoder()
+        dec.reset_decoder(0)
+        dec.enqueue_syndromes(0, 3, 0b101, 0)
+        corrections = dec.get_corrections(0, 2, 1)
+        dec.discard()
+        return corrections
+
+    validate(main.compile())
+
+
+def test_pack_int(run_int_fn):
+    @guppy
+    @no_type_check
+    def main() -> int:
+        return pack_int(4, array(True, False, True, True))
+
+    run_int_fn(main, 0b1011)
+
+
+def test_pack_int_empty(run_int_fn):
+    @guppy
+    @no_type_check
+    def main() -> int:
+        return pack_int(0, array())
+
+    run_int_fn(main, 0)
+
+
+def test_pack_int_too_large(run_int_fn):
+    @guppy
+    @no_type_check
+    def main() -> int:
+        return pack_int(65, array(False for _ in range(65)))
+
+    with pytest.raises(EmulatorError, match="Invalid array size for decoder"):
+        run_int_fn(main, 0)
+
+
+def test_unpack_int(run_int_fn):
+    @guppy
+    @no_type_check
+    def main() -> int:
+        bits = unpack_int(0b1011, 4)
+        return 8 * int(bits[0]) + 4 * int(bits[1]) + 2 * int(bits[2]) + int(bits[3])
+
+    run_int_fn(main, 0b1011)
+
+
+def test_unpack_int_le(run_int_fn):
+    @guppy
+    @no_type_check
+    def main() -> int:
+        bits = unpack_int_le(0b1011, 4)
+        return int(bits[0]) + 2 * int(bits[1]) + 4 * int(bits[2]) + 8 * int(bits[3])
+
+    run_int_fn(main, 0b1011)
+
+
+def test_pack_unpack_roundtrip(run_int_fn):
+    @guppy
+    @no_type_check
+    def main() -> int:
+        return pack_int(12, unpack_int(0xA5C, 12))
+
+    run_int_fn(main, 0xA5C)
@@ -1,3 +1,7 @@
+from typing import no_type_check
+
+import pytest
+
 from guppy_gpu.decorator import gpu_module, gpu
 from guppylang.decorator import guppy
 from guppylang.std.builtins import nat
@@ -122,3 +126,83 @@ def test_lookup_by_name(validate):
                     pass
     assert "lookup_by_name" in ops
     assert "lookup_by_id" not in ops
+
+
+def test_unsupported_type():
+    from guppylang_internals.error import GuppyError
+
+    from guppy_gpu.errors import UnconvertibleType
+
+    @gpu_module("", None)
+    class MyGpu:
+        @gpu
+        def foo(self: "MyGpu", x: bool) -> None: ...
+
+    @guppy
+    def main() -> None:
+        c = MyGpu()
+        c.foo(True)
+        c.discard()
+
+    with pytest.raises(GuppyError) as exc_info:
+        main.compile()
+    assert isinstance(exc_info.value.error, UnconvertibleType)
+
+
+def test_first_arg_not_module():
+    from guppylang_internals.error import GuppyError
+
+    from guppylang.std.builtins import owned
+
+    from guppy_gpu.errors import FirstArgNotModule
+
+    @gpu_module("", None)
+    class MyGpu:
+        @gpu
+        @no_type_check
+        def foo(self: "MyGpu" @ owned) -> None: ...
+
+    @guppy
+    def main() -> None:
+        c = MyGpu()
+        c.foo()
+
+    with pytest.raises(GuppyError) as exc_info:
+        main.compile()
+    assert isinstance(exc_info.value.error, FirstArgNotModule)
+
+
+def test_first_arg_borrowed_not_module():
+    from guppylang_internals.error import GuppyError
+
+    from guppylang.std.quantum import qubit
+
+    from guppy_gpu.errors import FirstArgNotModule
+
+    # Borrowed non-copyable arguments are inout, so these reach the check for a GPU
+    # module type. `qubit` has a type definition, a tuple doesn't.
+    @gpu
+    def foo(q: qubit) -> None: ...
+
+    @gpu
+    def bar(qs: tuple[qubit, qubit]) -> None: ...
+
+    @guppy
+    def call_foo() -> None:
+        q = qubit()
+        foo(q)
+        q.discard()
+
+    @guppy
+    @no_type_check
+    def call_bar() -> None:
+        qs = (qubit(), qubit())
+        bar(qs)
+        a, b = qs
+        a.discard()
+        b.discard()
+
+    for main in (call_foo, call_bar):
+        with pytest.raises(GuppyError) as exc_info:
+            main.compile()
+        assert isinstance(exc_info.value.error, FirstArgNotModule)